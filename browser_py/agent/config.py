@@ -6,73 +6,111 @@ The agent section is nested under "agent" key.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 CONFIG_DIR = Path.home() / ".browser-py"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
-# Provider defaults
-PROVIDERS = {
-    "openrouter": {
-        "name": "OpenRouter",
-        "env_key": "OPENROUTER_API_KEY",
-        "default_model": "anthropic/claude-sonnet-4-6",
-        "base_url": "https://openrouter.ai/api/v1",
-    },
-    "anthropic": {
-        "name": "Anthropic",
-        "env_key": "ANTHROPIC_API_KEY",
-        "default_model": "claude-sonnet-4-6",
-    },
-    "claude_max": {
-        "name": "Claude Max (OAuth)",
-        "env_key": "ANTHROPIC_API_KEY",
-        "default_model": "claude-sonnet-4-6",
-        "note": "Uses Claude Code OAuth token (sk-ant-oat01-...) from your Max/Pro subscription",
-        "is_oauth": True,
-    },
-    "openai": {
-        "name": "OpenAI",
-        "env_key": "OPENAI_API_KEY",
-        "default_model": "gpt-4o",
-    },
-    "bedrock": {
-        "name": "AWS Bedrock",
-        "env_key": "AWS_ACCESS_KEY_ID",
-        "default_model": "bedrock/anthropic.claude-sonnet-4-6-v1:0",
-        "note": "Uses AWS credentials. Configure Access Key + Secret Key + Region, or use env vars / AWS CLI profile.",
-        "fields": [
+# orjson (Rust SIMD parser) decodes ~3-5x faster than stdlib json; fall
+# back silently when it isn't installed
+try:
+    import orjson
+
+    def _loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# Parsed-config cache keyed by the file's (st_mtime_ns, st_size) so external
+# edits invalidate it automatically. Saves a disk read + JSON parse on every
+# helper call (get_model, get_workspace, is_configured, ...).
+_config_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+# Provider defaults. Frozen slotted rows: attribute access is a C-level
+# descriptor lookup (no per-call .get default allocation), and the table
+# is immutable so it can be shared freely across threads.
+@dataclass(frozen=True, slots=True)
+class ProviderInfo:
+    name: str
+    env_key: str
+    default_model: str
+    base_url: str | None = None
+    note: str = ""
+    is_oauth: bool = False
+    fields: tuple[dict[str, Any], ...] = ()
+
+
+PROVIDERS: Final[dict[str, ProviderInfo]] = {
+    "openrouter": ProviderInfo(
+        name="OpenRouter",
+        env_key="OPENROUTER_API_KEY",
+        default_model="anthropic/claude-sonnet-4-6",
+        base_url="https://openrouter.ai/api/v1",
+    ),
+    "anthropic": ProviderInfo(
+        name="Anthropic",
+        env_key="ANTHROPIC_API_KEY",
+        default_model="claude-sonnet-4-6",
+    ),
+    "claude_max": ProviderInfo(
+        name="Claude Max (OAuth)",
+        env_key="ANTHROPIC_API_KEY",
+        default_model="claude-sonnet-4-6",
+        note="Uses Claude Code OAuth token (sk-ant-oat01-...) from your Max/Pro subscription",
+        is_oauth=True,
+    ),
+    "openai": ProviderInfo(
+        name="OpenAI",
+        env_key="OPENAI_API_KEY",
+        default_model="gpt-4o",
+    ),
+    "bedrock": ProviderInfo(
+        name="AWS Bedrock",
+        env_key="AWS_ACCESS_KEY_ID",
+        default_model="bedrock/anthropic.claude-sonnet-4-6-v1:0",
+        note="Uses AWS credentials. Configure Access Key + Secret Key + Region, or use env vars / AWS CLI profile.",
+        fields=(
             {"key": "aws_access_key_id", "label": "AWS Access Key ID", "env": "AWS_ACCESS_KEY_ID", "secret": True},
             {"key": "aws_secret_access_key", "label": "AWS Secret Access Key", "env": "AWS_SECRET_ACCESS_KEY", "secret": True},
             {"key": "aws_region", "label": "AWS Region", "env": "AWS_REGION_NAME", "placeholder": "us-east-1"},
             {"key": "aws_profile", "label": "AWS Profile (optional)", "env": "AWS_PROFILE", "placeholder": "default"},
-        ],
-    },
-    "azure": {
-        "name": "Azure OpenAI",
-        "env_key": "AZURE_API_KEY",
-        "default_model": "azure/gpt-4o",
-        "note": "Requires API key, endpoint URL, and API version from your Azure OpenAI resource.",
-        "fields": [
+        ),
+    ),
+    "azure": ProviderInfo(
+        name="Azure OpenAI",
+        env_key="AZURE_API_KEY",
+        default_model="azure/gpt-4o",
+        note="Requires API key, endpoint URL, and API version from your Azure OpenAI resource.",
+        fields=(
             {"key": "api_key", "label": "API Key", "secret": True},
             {"key": "base_url", "label": "Endpoint URL", "placeholder": "https://your-resource.openai.azure.com"},
             {"key": "api_version", "label": "API Version", "placeholder": "2024-02-01"},
-        ],
-    },
-    "vertex": {
-        "name": "Google Vertex AI",
-        "env_key": "GOOGLE_APPLICATION_CREDENTIALS",
-        "default_model": "vertex_ai/gemini-2.0-flash",
-        "note": "Uses Google Cloud auth. Set credentials file path + project ID, or use gcloud CLI auth.",
-        "fields": [
+        ),
+    ),
+    "vertex": ProviderInfo(
+        name="Google Vertex AI",
+        env_key="GOOGLE_APPLICATION_CREDENTIALS",
+        default_model="vertex_ai/gemini-2.0-flash",
+        note="Uses Google Cloud auth. Set credentials file path + project ID, or use gcloud CLI auth.",
+        fields=(
             {"key": "credentials_path", "label": "Service Account JSON Path", "env": "GOOGLE_APPLICATION_CREDENTIALS", "placeholder": "/path/to/service-account.json"},
             {"key": "project", "label": "Project ID", "env": "VERTEXAI_PROJECT", "placeholder": "my-gcp-project"},
             {"key": "location", "label": "Location", "env": "VERTEXAI_LOCATION", "placeholder": "us-central1"},
-        ],
-    },
+        ),
+    ),
 }
 
 
@@ -108,20 +146,84 @@ def detect_claude_oauth_token() -> str | None:
     return None
 
 
+def _stat_token() -> tuple[int, int] | None:
+    """Cheap change-detection token for the config file (None if missing)."""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_config_cached() -> dict[str, Any]:
+    """Load config, reusing the in-memory parse while the file is unchanged.
+
+    Returns the shared cached dict — callers must not mutate it. Use
+    load_config() for a private copy.
+    """
+    global _config_cache
+    token = _stat_token()
+    if token is None:
+        return {"default": None, "profiles": {}}
+    if _config_cache is not None and _config_cache[0] == token:
+        return _config_cache[1]
+    try:
+        config = _loads(CONFIG_FILE.read_bytes())
+    except (ValueError, OSError):
+        return {"default": None, "profiles": {}}
+    _config_cache = (token, config)
+    return config
+
+
 def load_config() -> dict[str, Any]:
     """Load full config (profiles + agent settings)."""
-    if CONFIG_FILE.exists():
+    return copy.deepcopy(_load_config_cached())
+
+
+def _atomic_write_bytes(path: Path, data: bytes, durable: bool = True) -> None:
+    """Write via a sibling temp file + os.replace so readers never see a torn file.
+
+    A crash mid-write leaves the old file intact instead of a truncated one.
+    Set durable=False to skip the fsync for scratch files where losing the
+    last write on power failure is acceptable.
+    """
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
         try:
-            return json.loads(CONFIG_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
+            view = memoryview(data)
+            while view:  # os.write may be partial for very large buffers
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
             pass
-    return {"default": None, "profiles": {}}
+        raise
+
+
+def _atomic_write_text(path: Path, data: str, encoding: str = "utf-8", durable: bool = True) -> None:
+    """Atomic write for str payloads — encodes once and defers to the bytes path."""
+    _atomic_write_bytes(path, data.encode(encoding), durable=durable)
 
 
 def save_config(config: dict[str, Any]) -> None:
     """Write config to disk."""
+    global _config_cache
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2) + "\n")
+    _atomic_write_text(CONFIG_FILE, _dumps(config) + "\n")
+    token = _stat_token()
+    if token is not None:
+        _config_cache = (token, copy.deepcopy(config))
+
+
+def _agent_cfg() -> dict[str, Any]:
+    """Shared read-only view of the agent config section. Do not mutate."""
+    return _load_config_cached().get("agent", {})
 
 
 def get_agent_config() -> dict[str, Any]:
@@ -141,8 +243,7 @@ def set_agent_config(agent_cfg: dict[str, Any]) -> None:
 
 def get_provider_key(provider: str) -> str | None:
     """Get API key for a provider from config, then env."""
-    agent_cfg = get_agent_config()
-    providers = agent_cfg.get("providers", {})
+    providers = _agent_cfg().get("providers", {})
 
     # Check config first
     key = providers.get(provider, {}).get("api_key")
@@ -150,24 +251,21 @@ def get_provider_key(provider: str) -> str | None:
         return key
 
     # Fall back to environment variable
-    info = PROVIDERS.get(provider, {})
-    env_key = info.get("env_key")
-    if env_key:
-        return os.environ.get(env_key)
+    info = PROVIDERS.get(provider)
+    if info is not None:
+        return os.environ.get(info.env_key)
 
     return None
 
 
 def get_model() -> str:
     """Get the configured model name."""
-    agent_cfg = get_agent_config()
-    return agent_cfg.get("model", "claude-sonnet-4-6")
+    return _agent_cfg().get("model", "claude-sonnet-4-6")
 
 
 def get_workspace() -> Path:
     """Get the workspace directory (sandboxed file operations)."""
-    agent_cfg = get_agent_config()
-    ws = agent_cfg.get("workspace")
+    ws = _agent_cfg().get("workspace")
     if ws:
         return Path(ws).expanduser().resolve()
     # Default: ~/browser-py-workspace
@@ -176,13 +274,12 @@ def get_workspace() -> Path:
 
 def get_provider() -> str:
     """Get the configured provider name."""
-    agent_cfg = get_agent_config()
-    return agent_cfg.get("provider", "openrouter")
+    return _agent_cfg().get("provider", "openrouter")
 
 
 def is_configured() -> bool:
     """Check if the agent has been set up."""
-    agent_cfg = get_agent_config()
+    agent_cfg = _agent_cfg()
     return bool(agent_cfg.get("provider") and agent_cfg.get("workspace"))
 
 
@@ -195,13 +292,12 @@ def get_provider_credentials_status() -> dict[str, Any]:
         "bedrock": {"configured": True, "fields": {"aws_access_key_id": {"configured": True, "masked": "AKIA...XYZ"}, ...}},
     }
     """
-    agent_cfg = get_agent_config()
-    providers_cfg = agent_cfg.get("providers", {})
+    providers_cfg = _agent_cfg().get("providers", {})
     result: dict[str, Any] = {}
 
     for pkey, pinfo in PROVIDERS.items():
         pcfg = providers_cfg.get(pkey, {})
-        fields = pinfo.get("fields")
+        fields = pinfo.fields
 
         if fields:
             # Multi-field provider (Bedrock, Azure, Vertex)
@@ -224,7 +320,7 @@ def get_provider_credentials_status() -> dict[str, Any]:
         else:
             # Single API key provider
             key = pcfg.get("api_key", "")
-            env_key = os.environ.get(pinfo.get("env_key", ""), "")
+            env_key = os.environ.get(pinfo.env_key, "")
             val = key or env_key
             if val:
                 source = "config" if key else "env"
@@ -24,7 +24,7 @@ from datetime import date
 from pathlib import Path
 from typing import Any, Callable
 
-from browser_py.agent.config import get_agent_config, get_model, get_provider, get_provider_key, PROVIDERS
+from browser_py.agent.config import get_agent_config, get_model, get_provider, get_provider_key
 
 
 # ── Prompts ──
@@ -236,7 +236,6 @@ def _call_llm_simple(prompt: str, system: str = "", max_tokens: int = 4096) -> s
     key = get_provider_key(provider)
     model = get_model()
 
-    info = PROVIDERS.get(provider, {})
     if provider == "openrouter":
         os.environ["OPENROUTER_API_KEY"] = key
     elif provider in ("anthropic", "claude_max"):
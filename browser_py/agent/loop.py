@@ -219,16 +219,15 @@ class Agent:
         key = get_provider_key(provider)
 
         if not key:
-            info = PROVIDERS.get(provider, {})
+            info = PROVIDERS.get(provider)
             raise ValueError(
                 f"No API key found for {provider}.\n"
                 f"Set it via: bpy setup\n"
-                f"Or env var: {info.get('env_key', '?')}"
+                f"Or env var: {info.env_key if info else '?'}"
             )
 
         # Set the appropriate env vars for LiteLLM
         import os
-        info = PROVIDERS.get(provider, {})
 
         if provider == "openrouter":
             os.environ["OPENROUTER_API_KEY"] = key
@@ -544,6 +543,47 @@ class Agent:
         # Complex task — run via subtask decomposition
         return self._chat_decomposed(user_message, subtasks)
 
+    def chat_stream(self, user_message: str):
+        """Yield chat progress events as they happen, ending with the result.
+
+        Runs chat() on a worker thread with the tool-call and message
+        callbacks redirected into the stream, so callers can forward each
+        event (e.g. over a WebSocket) instead of blocking for the full
+        turn. Yields dicts shaped like the server's broadcast frames:
+        tool_call / message events, then a final "response" (or "error").
+        The instance callbacks are suppressed for the duration — the
+        stream replaces them — and restored afterwards.
+        """
+        import queue
+        import threading
+
+        q: queue.Queue[dict | None] = queue.Queue()
+        prev_tool, prev_msg = self.on_tool_call, self.on_message
+
+        self.on_tool_call = lambda name, params, result: q.put({
+            "type": "tool_call", "tool": name, "params": params,
+            "result": result[:2000] if len(result) > 2000 else result,
+        })
+        self.on_message = lambda text: q.put({"type": "message", "content": text})
+
+        def _run() -> None:
+            try:
+                q.put({"type": "response", "content": self.chat(user_message)})
+            except Exception as e:
+                q.put({"type": "error", "error": str(e)})
+            finally:
+                q.put(None)
+
+        threading.Thread(target=_run, daemon=True).start()
+        try:
+            while True:
+                item = q.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            self.on_tool_call, self.on_message = prev_tool, prev_msg
+
     def _chat_decomposed(self, user_message: str, subtasks: list) -> str:
         """Execute a complex task via subtask decomposition.
 
@@ -6,18 +6,50 @@ Results are cached for 10 minutes to avoid hammering endpoints.
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
 import os
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException, HTTPSConnection
+from operator import itemgetter
 from typing import Any
-from urllib.request import Request, urlopen
-from urllib.error import URLError
+from urllib.parse import urlsplit
 
-from browser_py.agent.config import get_provider_key, PROVIDERS
+from browser_py.agent.config import get_provider_key, CONFIG_DIR, _atomic_write_text
 
-# Cache: {provider: (timestamp, [models])}
-_cache: dict[str, tuple[float, list[dict]]] = {}
+# orjson parses the ~100KB OpenRouter catalog several times faster than
+# stdlib json and accepts bytes directly (no decode copy)
+try:
+    import orjson
+
+    def _loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+# Cache: {provider: (timestamp, [models])}. A None models value is a
+# negative entry — the last fetch failed, don't retry until _NEG_TTL passes.
+_cache: dict[str, tuple[float, list[dict] | None]] = {}
+_cache_lock = threading.Lock()  # fetch_models may run from several threads
 _CACHE_TTL = 600  # 10 minutes
+_NEG_TTL = 60  # back off this long after a failed fetch
+
+# Cache persists across CLI invocations so warm starts skip the network
+_CACHE_FILE = CONFIG_DIR / "models_cache.json"
+
+# Shared pool for concurrent per-provider fetches
+_fetch_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="models")
 
 # Hardcoded fallbacks (used when API is unreachable or no key)
 _FALLBACKS: dict[str, list[dict]] = {
@@ -81,14 +113,91 @@ _FALLBACKS: dict[str, list[dict]] = {
 }
 
 
+def _load_cache_from_disk() -> None:
+    """Seed _cache from the persisted copy (best-effort)."""
+    try:
+        data = _loads(_CACHE_FILE.read_bytes())
+    except (ValueError, OSError):
+        return
+    if not isinstance(data, dict):
+        return
+    for provider, entry in data.items():
+        ts = entry.get("ts")
+        models = entry.get("models")
+        if isinstance(ts, (int, float)) and isinstance(models, list):
+            _cache[provider] = (ts, models)
+
+
+def _save_cache() -> None:
+    """Persist positive cache entries to disk (atomic, best-effort)."""
+    with _cache_lock:
+        data = {p: {"ts": ts, "models": models}
+                for p, (ts, models) in _cache.items() if models is not None}
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(_CACHE_FILE, _dumps(data), durable=False)
+    except OSError:
+        pass
+
+
+_load_cache_from_disk()
+
+
+# Keep-alive connections, one per host — skips the TCP+TLS handshake when
+# the same provider endpoint is probed repeatedly (settings UI, key checks)
+_connections: dict[str, HTTPSConnection] = {}
+_connections_lock = threading.Lock()
+
+
 def _fetch_json(url: str, headers: dict[str, str] | None = None, timeout: float = 10) -> Any:
-    """Fetch JSON from a URL with optional headers."""
-    req = Request(url)
-    if headers:
-        for k, v in headers.items():
-            req.add_header(k, v)
-    resp = urlopen(req, timeout=timeout)
-    return json.loads(resp.read())
+    """Fetch JSON from a URL with optional headers, reusing connections."""
+    parts = urlsplit(url)
+    host = parts.netloc
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    req_headers = {"Accept-Encoding": "gzip", **(headers or {})}
+
+    body = b""
+    for attempt in (0, 1):
+        with _connections_lock:
+            conn = _connections.pop(host, None)
+        if conn is None:
+            conn = HTTPSConnection(host, timeout=timeout)
+        try:
+            conn.request("GET", path, headers=req_headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (HTTPException, OSError):
+            # Stale keep-alive connection — retry once on a fresh one
+            conn.close()
+            if attempt:
+                raise
+            continue
+        if resp.status >= 400:
+            conn.close()
+            raise OSError(f"HTTP {resp.status} for {url}")
+        with _connections_lock:
+            if host in _connections:
+                conn.close()
+            else:
+                _connections[host] = conn
+        break
+
+    if body[:2] == b"\x1f\x8b":  # gzip magic
+        body = gzip.decompress(body)
+    return _loads(body)
+
+
+# Provider prefix → sort priority for the OpenRouter catalog; one dict
+# lookup per model instead of a chain of startswith calls
+_SORT_BUCKETS = {
+    "anthropic": 0,
+    "openai": 1,
+    "google": 2,
+    "meta-llama": 3,
+    "deepseek": 4,
+    "mistralai": 5,
+}
+_OTHER_BUCKET = 6
 
 
 def _fetch_openrouter(api_key: str | None) -> list[dict]:
@@ -127,26 +236,13 @@ def _fetch_openrouter(api_key: str | None) -> list[dict]:
             "cost": prompt_cost,
             "supports_tool_use": supports_tools,
             "is_meta_router": is_meta,
+            "_bucket": _SORT_BUCKETS.get(mid.partition("/")[0], _OTHER_BUCKET),
         })
 
     # Sort: anthropic first, then openai, then google, then rest alphabetically
-    def sort_key(m):
-        mid = m["id"]
-        if mid.startswith("anthropic/"):
-            return (0, mid)
-        if mid.startswith("openai/"):
-            return (1, mid)
-        if mid.startswith("google/"):
-            return (2, mid)
-        if mid.startswith("meta-llama/"):
-            return (3, mid)
-        if mid.startswith("deepseek/"):
-            return (4, mid)
-        if mid.startswith("mistralai/"):
-            return (5, mid)
-        return (6, mid)
-
-    results.sort(key=sort_key)
+    results.sort(key=itemgetter("_bucket", "id"))
+    for m in results:
+        del m["_bucket"]
     return results
 
 
@@ -171,6 +267,11 @@ def _fetch_anthropic(api_key: str) -> list[dict]:
     return results
 
 
+# Chat-capable model id prefixes — one C-level regex match per model
+# instead of a Python loop of startswith calls
+_OPENAI_CHAT_MODELS = re.compile(r"^(?:gpt-4|gpt-3\.5|o1|o3|chatgpt)")
+
+
 def _fetch_openai(api_key: str) -> list[dict]:
     """Fetch models from OpenAI's API."""
     data = _fetch_json(
@@ -182,9 +283,7 @@ def _fetch_openai(api_key: str) -> list[dict]:
     for m in models:
         mid = m.get("id", "")
         # Filter to chat models only
-        if any(mid.startswith(p) for p in [
-            "gpt-4", "gpt-3.5", "o1", "o3", "chatgpt",
-        ]):
+        if _OPENAI_CHAT_MODELS.match(mid):
             results.append({"id": mid, "name": mid})
 
     results.sort(key=lambda m: m["id"])
@@ -256,10 +355,17 @@ def fetch_models(
     """
     extra = extra or {}
 
-    # Check cache
-    if provider in _cache:
-        ts, cached = _cache[provider]
-        if time.monotonic() - ts < _CACHE_TTL:
+    # Check cache (includes entries persisted from previous runs)
+    now = time.time()
+    with _cache_lock:
+        entry = _cache.get(provider)
+    if entry is not None:
+        ts, cached = entry
+        if cached is None:
+            # Recent failed fetch — don't hang the UI retrying yet
+            if now - ts < _NEG_TTL:
+                return _FALLBACKS.get(provider, [])
+        elif now - ts < _CACHE_TTL:
             return cached
 
     # Resolve key
@@ -290,7 +396,9 @@ def fetch_models(
             return _FALLBACKS.get(provider, [])
 
         if models:
-            _cache[provider] = (time.monotonic(), models)
+            with _cache_lock:
+                _cache[provider] = (time.time(), models)
+            _save_cache()
 
             # Filter for tool-use support if requested
             if tool_use_only and provider == "openrouter":
@@ -301,8 +409,54 @@ def fetch_models(
 
             return models
 
-    except (URLError, OSError, json.JSONDecodeError, KeyError, TypeError):
-        pass
+    except (HTTPException, OSError, ValueError, KeyError, TypeError):
+        with _cache_lock:
+            _cache[provider] = (time.time(), None)
 
     # Fallback
     return _FALLBACKS.get(provider, [])
+
+
+def fetch_models_multi(providers: list[str]) -> dict[str, list[dict]]:
+    """Fetch model lists for several providers concurrently.
+
+    Each provider fetch is an independent HTTPS GET with a few hundred ms
+    of latency, so fanning out over the shared pool turns the sum of those
+    latencies into the max. Warm providers are answered from the cache.
+
+    Returns {provider: [models]} in the same shape as fetch_models.
+    """
+    futures = {p: _fetch_pool.submit(fetch_models, p) for p in providers}
+    return {p: f.result() for p, f in futures.items()}
+
+
+async def fetch_models_async(
+    provider: str,
+    api_key: str | None = None,
+    extra: dict | None = None,
+    tool_use_only: bool = False,
+) -> list[dict]:
+    """Async twin of fetch_models for use on an event loop.
+
+    The blocking fetch runs in a worker thread so the loop keeps serving
+    other coroutines. The shared cache still applies, so warm calls
+    return almost immediately.
+    """
+    return await asyncio.to_thread(
+        fetch_models, provider, api_key, extra, tool_use_only=tool_use_only
+    )
+
+
+async def fetch_all_async(providers: list[str]) -> dict[str, list[dict]]:
+    """Fetch several providers concurrently from async code.
+
+    Kicks off all fetches, then gathers — total latency is the slowest
+    provider. A provider whose fetch raises gets its fallback list.
+    """
+    results = await asyncio.gather(
+        *(fetch_models_async(p) for p in providers), return_exceptions=True
+    )
+    return {
+        p: r if isinstance(r, list) else _FALLBACKS.get(p, [])
+        for p, r in zip(providers, results)
+    }
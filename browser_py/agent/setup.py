@@ -85,14 +85,14 @@ def run_setup() -> None:
         note = ""
         if key == "claude_max":
             note = _dim(" — use your Max/Pro subscription, no API costs")
-        print(f"  {i}. {info['name']}{note}{_green(current)}")
+        print(f"  {i}. {info.name}{note}{_green(current)}")
 
     print(_dim("  --- Cloud providers (require SDK auth) ---"))
     for i, key in enumerate(tier2, len(tier1) + 1):
         info = PROVIDERS[key]
-        note = f" — {info.get('note', '')}" if info.get("note") else ""
+        note = f" — {info.note}" if info.note else ""
         current = " ✓" if key == agent_cfg.get("provider") else ""
-        print(f"  {i}. {info['name']}{_dim(note)}{_green(current)}")
+        print(f"  {i}. {info.name}{_dim(note)}{_green(current)}")
 
     print()
     all_providers = tier1 + tier2
@@ -106,7 +106,7 @@ def run_setup() -> None:
         provider_key = "openrouter"
 
     agent_cfg["provider"] = provider_key
-    print(f"  → {_green(PROVIDERS[provider_key]['name'])}")
+    print(f"  → {_green(PROVIDERS[provider_key].name)}")
     print()
 
     # ── Step 2: API Key ──
@@ -114,7 +114,7 @@ def run_setup() -> None:
     info = PROVIDERS[provider_key]
 
     existing_key = providers_cfg.get(provider_key, {}).get("api_key", "")
-    env_key = os.environ.get(info.get("env_key", ""), "")
+    env_key = os.environ.get(info.env_key, "")
     has_key = existing_key or env_key
 
     if has_key:
@@ -145,11 +145,11 @@ def run_setup() -> None:
                     print(_yellow("  Warning: no token provided. Set ANTHROPIC_API_KEY env var later."))
                 providers_cfg.setdefault(provider_key, {})["api_key"] = key
         elif provider_key in ("bedrock", "vertex"):
-            print(f"  {_yellow('Note:')} {info.get('note', '')}")
+            print(f"  {_yellow('Note:')} {info.note}")
             print(f"  Set these env vars before running bpy agent/serve.")
             providers_cfg.setdefault(provider_key, {})["api_key"] = "env"
         else:
-            key = _input(f"  {info['name']} API key")
+            key = _input(f"  {info.name} API key")
             if not key:
                 print(_yellow("  Warning: no key provided. Set it later or via env var."))
             providers_cfg.setdefault(provider_key, {})["api_key"] = key
@@ -166,7 +166,7 @@ def run_setup() -> None:
 
     # ── Step 3: Model ──
     print(_cyan("Step 3: Model"))
-    default_model = info["default_model"]
+    default_model = info.default_model
     current_model = agent_cfg.get("model", default_model)
     model = _input(f"  Model name", current_model)
     agent_cfg["model"] = model
@@ -0,0 +1,26 @@
+"""Batched execution for multi-file tool operations.
+
+The agent often wants several independent file reads or listings in one
+turn. Running them through a shared thread pool overlaps the underlying
+syscalls instead of serializing them, while results come back in request
+order.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="files-batch")
+
+
+def run_batch(calls: list[Callable[[], Any]]) -> list[Any]:
+    """Run independent callables concurrently, returning results in order.
+
+    A single call runs inline — no point paying the pool handoff for it.
+    An exception from a call propagates when its slot is collected.
+    """
+    if len(calls) == 1:
+        return [calls[0]()]
+    futures = [_pool.submit(c) for c in calls]
+    return [f.result() for f in futures]
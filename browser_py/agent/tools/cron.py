@@ -13,6 +13,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+# orjson parses the job file several times faster than stdlib json and
+# takes bytes directly; fall back silently when it isn't installed
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 TOOL_SCHEMA = {
     "type": "function",
     "function": {
@@ -83,18 +100,16 @@ _JOBS_FILE = Path.home() / ".browser-py" / "jobs.json"
 
 def _load_jobs() -> dict[str, dict]:
     """Load jobs from disk."""
-    if _JOBS_FILE.exists():
-        try:
-            return json.loads(_JOBS_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
-    return {}
+    try:
+        return _loads(_JOBS_FILE.read_bytes())
+    except (ValueError, OSError):
+        return {}
 
 
 def _save_jobs(jobs: dict[str, dict]) -> None:
     """Save jobs to disk."""
     _JOBS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _JOBS_FILE.write_text(json.dumps(jobs, indent=2) + "\n")
+    _JOBS_FILE.write_text(_dumps(jobs) + "\n")
 
 
 class CronTool:
@@ -6,12 +6,15 @@ All paths are resolved relative to the workspace. Escape attempts
 
 from __future__ import annotations
 
+import functools
+import mmap
 import os
 import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from browser_py.agent.config import get_workspace
+from browser_py.agent.config import get_workspace, _atomic_write_bytes
+from browser_py.agent.tools._batch import run_batch
 
 TOOL_SCHEMA = {
     "type": "function",
@@ -20,19 +23,23 @@ TOOL_SCHEMA = {
         "description": (
             "Manage files in the workspace directory. Read, write, list, move, "
             "copy, and delete files. All paths are relative to the workspace — "
-            "you cannot access files outside it."
+            "you cannot access files outside it. When you need several "
+            "directories listed or several files read, prefer one list_many/"
+            "read_many call over separate calls per path."
         ),
         "parameters": {
             "type": "object",
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["read", "write", "list", "move", "copy", "delete", "mkdir", "info", "grep"],
+                    "enum": ["read", "read_many", "write", "list", "list_many", "move", "copy", "delete", "mkdir", "info", "grep"],
                     "description": (
                         "File action:\n"
                         "- read: Read file contents (requires 'path')\n"
+                        "- read_many: Read several files in one call (requires 'paths')\n"
                         "- write: Write/create file (requires 'path' and 'content')\n"
                         "- list: List directory contents (optional 'path', default root)\n"
+                        "- list_many: List several directories in one call (requires 'paths')\n"
                         "- move: Move/rename file (requires 'path' and 'destination')\n"
                         "- copy: Copy file (requires 'path' and 'destination')\n"
                         "- delete: Delete file or directory (requires 'path')\n"
@@ -42,10 +49,12 @@ TOOL_SCHEMA = {
                     ),
                 },
                 "path": {"type": "string", "description": "File or directory path (relative to workspace)"},
+                "paths": {"type": "array", "items": {"type": "string"}, "description": "Paths for read_many/list_many"},
                 "content": {"type": "string", "description": "File content for write action"},
                 "query": {"type": "string", "description": "Search query for grep action (case-insensitive)"},
                 "glob": {"type": "string", "description": "File glob pattern for grep (default: *.md,*.txt,*.py,*.json,*.csv)"},
                 "destination": {"type": "string", "description": "Destination path for move/copy"},
+                "preserve_metadata": {"type": "boolean", "description": "Copy timestamps/permissions too (copy action, default false)"},
                 "encoding": {"type": "string", "description": "File encoding (default: utf-8)"},
             },
             "required": ["action"],
@@ -54,52 +63,110 @@ TOOL_SCHEMA = {
 }
 
 
+# Max text returned by a single read (chars)
+_READ_CAP = 50_000
+
+# Max combined text returned by read_many (chars)
+_READ_MANY_CAP = 200_000
+
+# Files at least this large go through copy_file_range (below it the
+# syscall setup outweighs the saved copying)
+_COPY_RANGE_MIN = 64 * 1024
+
+# Files larger than this are read through mmap; smaller ones stay on the
+# plain read() path where mmap setup cost dominates
+_MMAP_MIN = 64 * 1024
+
+
+def _copy_file_contents(src: Path, dst: Path) -> None:
+    """Copy file data, entirely in-kernel for large files on Linux.
+
+    os.copy_file_range moves the bytes without bouncing them through a
+    userspace buffer. Falls back to shutil.copyfile on platforms or
+    filesystems that don't support it.
+    """
+    size = src.stat().st_size
+    if size >= _COPY_RANGE_MIN and hasattr(os, "copy_file_range"):
+        try:
+            src_fd = os.open(src, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                try:
+                    remaining = size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    return
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        except OSError:
+            pass  # e.g. EXDEV/EINVAL on exotic filesystems — use the slow path
+    shutil.copyfile(str(src), str(dst))
+
+
+def _requires(*keys: str) -> Callable:
+    """Reject an action up front when required params are missing or empty."""
+    def deco(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(self: FilesTool, params: dict) -> str:
+            if any(not params.get(k) for k in keys):
+                return "Error: " + " and ".join(f"'{k}'" for k in keys) + " required"
+            return fn(self, params)
+        return wrapper
+    return deco
+
+
 class FilesTool:
     """Sandboxed file operations."""
 
     def __init__(self, workspace: Path | None = None) -> None:
         self._workspace = workspace
+        self._ws_prefix: str | None = None  # resolved workspace + trailing sep
+        self._workspace_ready = False  # directory known to exist
 
     @property
     def workspace(self) -> Path:
-        if self._workspace is None:
-            self._workspace = get_workspace()
-        self._workspace = self._workspace.resolve()
-        self._workspace.mkdir(parents=True, exist_ok=True)
+        if self._ws_prefix is None:
+            self._workspace = (self._workspace or get_workspace()).resolve()
+            self._ws_prefix = str(self._workspace) + os.sep
+        # mkdir once per instance — every file op reads this property, and
+        # an EEXIST round-trip per access adds up
+        if not self._workspace_ready:
+            self._workspace.mkdir(parents=True, exist_ok=True)
+            self._workspace_ready = True
         return self._workspace
 
     def _resolve(self, path: str) -> Path:
-        """Resolve a path within the workspace. Blocks escapes."""
-        resolved = (self.workspace / path).resolve()
-        ws_resolved = self.workspace.resolve()
-        if not str(resolved).startswith(str(ws_resolved)):
+        """Resolve a path within the workspace. Blocks escapes.
+
+        Does a normpath + prefix check against the cached resolved workspace
+        first, so ../ escapes are rejected before touching the filesystem.
+        The trailing separator in the prefix keeps a sibling like /ws2 from
+        matching /ws. A single realpath then guards against symlinked
+        components — one component walk per call instead of the old double
+        Path.resolve() plus per-access workspace re-resolve.
+        """
+        ws = str(self.workspace)
+        candidate = os.path.normpath(os.path.join(self._ws_prefix, path))
+        if candidate != ws and not candidate.startswith(self._ws_prefix):
+            raise PermissionError(f"Access denied: path escapes workspace — {path}")
+        real = os.path.realpath(candidate)
+        if real != ws and not real.startswith(self._ws_prefix):
             raise PermissionError(f"Access denied: path escapes workspace — {path}")
-        return resolved
+        return Path(real)
 
     def execute(self, **params: Any) -> str:
         action = params.get("action", "")
+        handler = self._DISPATCH.get(action)
+        if handler is None:
+            return f"Unknown action: {action}"
 
         try:
-            if action == "read":
-                return self._read(params)
-            elif action == "write":
-                return self._write(params)
-            elif action == "list":
-                return self._list(params)
-            elif action == "move":
-                return self._move(params)
-            elif action == "copy":
-                return self._copy(params)
-            elif action == "delete":
-                return self._delete(params)
-            elif action == "mkdir":
-                return self._mkdir(params)
-            elif action == "info":
-                return self._info(params)
-            elif action == "grep":
-                return self._grep(params)
-            else:
-                return f"Unknown action: {action}"
+            return handler(self, params)
         except PermissionError as e:
             return f"Permission denied: {e}"
         except FileNotFoundError as e:
@@ -107,37 +174,99 @@ class FilesTool:
         except Exception as e:
             return f"Error: {e}"
 
+    def execute_batch(self, ops: list[dict]) -> list[str]:
+        """Execute several independent file operations concurrently.
+
+        Each op is the same params dict execute() takes. Results come back
+        in request order; per-op errors are the usual error strings.
+        """
+        return run_batch([functools.partial(self.execute, **op) for op in ops])
+
+    @_requires("path")
     def _read(self, params: dict) -> str:
         path = params.get("path", "")
-        if not path:
-            return "Error: 'path' required"
         resolved = self._resolve(path)
         if not resolved.exists():
             return f"File not found: {path}"
         if resolved.is_dir():
             return f"'{path}' is a directory. Use action='list' instead."
         encoding = params.get("encoding", "utf-8")
+        size = resolved.stat().st_size
+        if size > _MMAP_MIN:
+            return self._read_mapped(resolved, size, encoding)
+        # Binary sniff: a NUL in the first 4KB means this isn't text
+        with open(resolved, "rb") as f:
+            if b"\x00" in f.read(4096):
+                return f"Binary file ({size} bytes). Cannot read as text."
+        # Read only what fits in the 50KB cap instead of loading the whole file
         try:
-            content = resolved.read_text(encoding=encoding)
+            with open(resolved, "r", encoding=encoding) as f:
+                content = f.read(_READ_CAP + 1)
         except UnicodeDecodeError:
-            # Binary file — return size info
-            size = resolved.stat().st_size
             return f"Binary file ({size} bytes). Cannot read as text."
-        # Cap at 50KB
-        if len(content) > 50_000:
-            content = content[:50_000] + f"\n\n... (truncated, {len(content)} chars total)"
+        if len(content) > _READ_CAP:
+            content = content[:_READ_CAP] + f"\n\n... (truncated, {size} bytes total)"
         return content
 
+    def _read_mapped(self, resolved: Path, size: int, encoding: str) -> str:
+        """Head-read a large file via mmap.
+
+        Slicing the map lets the OS demand-page only the head we return,
+        skipping the read()-into-heap copy and the TextIOWrapper layer that
+        the small-file path pays. Files this size always exceed the cap, so
+        the truncation note is unconditional.
+        """
+        fd = os.open(resolved, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                head = mm[: _READ_CAP + 1]
+        finally:
+            os.close(fd)
+        if b"\x00" in head[:4096]:
+            return f"Binary file ({size} bytes). Cannot read as text."
+        try:
+            content = head.decode(encoding)
+        except UnicodeDecodeError as e:
+            # A multibyte char split at the slice boundary is not binary data
+            if e.start < len(head) - 4:
+                return f"Binary file ({size} bytes). Cannot read as text."
+            content = head[: e.start].decode(encoding)
+        return content[:_READ_CAP] + f"\n\n... (truncated, {size} bytes total)"
+
+    @_requires("path")
     def _write(self, params: dict) -> str:
         path = params.get("path", "")
         content = params.get("content", "")
-        if not path:
-            return "Error: 'path' required"
         resolved = self._resolve(path)
         resolved.parent.mkdir(parents=True, exist_ok=True)
         encoding = params.get("encoding", "utf-8")
-        resolved.write_text(content, encoding=encoding)
-        return f"Written: {path} ({len(content)} chars)"
+        # Encode once and write the bytes — write_text would encode a second
+        # time inside TextIOWrapper. Atomic swap without the fsync cost since
+        # workspace files are scratch data.
+        data = content.encode(encoding)
+        _atomic_write_bytes(resolved, data, durable=False)
+        return f"Written: {path} ({len(data)} bytes)"
+
+    @_requires("paths")
+    def _read_many(self, params: dict) -> str:
+        """Read several files in one call, capped at a combined total."""
+        paths = params.get("paths") or []
+        encoding = params.get("encoding", "utf-8")
+        results = run_batch([
+            functools.partial(self._read, {"path": p, "encoding": encoding})
+            for p in paths
+        ])
+        sections = []
+        total = 0
+        for p, content in zip(paths, results):
+            if total >= _READ_MANY_CAP:
+                sections.append(f"=== {p} ===\n(skipped — combined read_many cap reached)")
+                continue
+            if total + len(content) > _READ_MANY_CAP:
+                content = content[:_READ_MANY_CAP - total] + "\n\n... (truncated — combined read_many cap reached)"
+            total += len(content)
+            sections.append(f"=== {p} ===\n{content}")
+        return "\n\n".join(sections)
 
     def _list(self, params: dict) -> str:
         path = params.get("path", ".")
@@ -147,17 +276,21 @@ class FilesTool:
         if not resolved.is_dir():
             return f"'{path}' is a file, not a directory."
 
-        entries = sorted(resolved.iterdir())
+        # scandir's DirEntry caches type/stat info from the directory sweep,
+        # so is_dir/stat below don't cost one syscall per entry
+        with os.scandir(resolved) as it:
+            entries = sorted(it, key=lambda e: e.name)
         if not entries:
             return f"(empty directory: {path})"
 
+        ws_prefix_len = len(str(self.workspace)) + 1
         lines = []
         for entry in entries:
-            rel = entry.relative_to(self.workspace)
-            if entry.is_dir():
+            rel = entry.path[ws_prefix_len:]
+            if entry.is_dir(follow_symlinks=False):
                 lines.append(f"  📁 {rel}/")
             else:
-                size = entry.stat().st_size
+                size = entry.stat(follow_symlinks=False).st_size
                 if size < 1024:
                     size_str = f"{size}B"
                 elif size < 1024 * 1024:
@@ -167,24 +300,34 @@ class FilesTool:
                 lines.append(f"  📄 {rel} ({size_str})")
         return "\n".join(lines)
 
+    @_requires("paths")
+    def _list_many(self, params: dict) -> str:
+        """List several directories in one call."""
+        paths = params.get("paths") or []
+        results = run_batch([functools.partial(self._list, {"path": p}) for p in paths])
+        return "\n\n".join(f"=== {p} ===\n{listing}" for p, listing in zip(paths, results))
+
+    @_requires("path", "destination")
     def _move(self, params: dict) -> str:
         src = params.get("path", "")
         dst = params.get("destination", "")
-        if not src or not dst:
-            return "Error: 'path' and 'destination' required"
         resolved_src = self._resolve(src)
         resolved_dst = self._resolve(dst)
         if not resolved_src.exists():
             return f"Source not found: {src}"
         resolved_dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(resolved_src), str(resolved_dst))
+        try:
+            # Both paths live under the workspace (same filesystem), so a
+            # plain rename — one syscall — almost always works
+            os.rename(resolved_src, resolved_dst)
+        except OSError:
+            shutil.move(str(resolved_src), str(resolved_dst))
         return f"Moved: {src} → {dst}"
 
+    @_requires("path", "destination")
     def _copy(self, params: dict) -> str:
         src = params.get("path", "")
         dst = params.get("destination", "")
-        if not src or not dst:
-            return "Error: 'path' and 'destination' required"
         resolved_src = self._resolve(src)
         resolved_dst = self._resolve(dst)
         if not resolved_src.exists():
@@ -192,14 +335,17 @@ class FilesTool:
         resolved_dst.parent.mkdir(parents=True, exist_ok=True)
         if resolved_src.is_dir():
             shutil.copytree(str(resolved_src), str(resolved_dst))
-        else:
+        elif params.get("preserve_metadata"):
             shutil.copy2(str(resolved_src), str(resolved_dst))
+        else:
+            # Content-only copy — skips the extra stat/utime/chmod syscalls
+            # of copy2, in-kernel for large files
+            _copy_file_contents(resolved_src, resolved_dst)
         return f"Copied: {src} → {dst}"
 
+    @_requires("path")
     def _delete(self, params: dict) -> str:
         path = params.get("path", "")
-        if not path:
-            return "Error: 'path' required"
         resolved = self._resolve(path)
         if not resolved.exists():
             return f"Not found: {path}"
@@ -212,18 +358,16 @@ class FilesTool:
             resolved.unlink()
             return f"Deleted: {path}"
 
+    @_requires("path")
     def _mkdir(self, params: dict) -> str:
         path = params.get("path", "")
-        if not path:
-            return "Error: 'path' required"
         resolved = self._resolve(path)
         resolved.mkdir(parents=True, exist_ok=True)
         return f"Created directory: {path}"
 
+    @_requires("path")
     def _info(self, params: dict) -> str:
         path = params.get("path", "")
-        if not path:
-            return "Error: 'path' required"
         resolved = self._resolve(path)
         if not resolved.exists():
             return f"Not found: {path}"
@@ -284,3 +428,18 @@ class FilesTool:
             return f"No matches for '{query}' in {scope}"
         header = f"Found {len(matches)} match(es) for '{query}':\n\n"
         return header + "\n".join(matches)
+
+    # O(1) action dispatch instead of an if/elif chain in execute()
+    _DISPATCH: dict[str, Callable] = {
+        "read": _read,
+        "read_many": _read_many,
+        "write": _write,
+        "list": _list,
+        "list_many": _list_many,
+        "move": _move,
+        "copy": _copy,
+        "delete": _delete,
+        "mkdir": _mkdir,
+        "info": _info,
+        "grep": _grep,
+    }
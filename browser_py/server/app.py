@@ -6,26 +6,92 @@ Start with: bpy serve [--port 8321]
 from __future__ import annotations
 
 import asyncio
+import gzip
+import hashlib
 import json
+import logging
 import os
+import sys
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from browser_py.agent.config import get_agent_config, get_workspace, is_configured
 from browser_py.agent.loop import Agent
 
+# uvloop (ships with uvicorn[standard], absent on Windows) cuts per-frame
+# overhead on the WebSocket broadcast path
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# APScheduler is optional (agent extra) — checked once at import so the
+# scheduler path is a plain flag test at startup
+try:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.date import DateTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+    _APS_AVAILABLE = True
+except ImportError:
+    _APS_AVAILABLE = False
+
+# orjson serializes broadcast frames several times faster than stdlib json
+# and emits bytes directly (no per-client encode); fall back when missing
+try:
+    import orjson
+
+    def _loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 app = FastAPI(title="browser-py", docs_url=None, redoc_url=None)
 
+# Serve bundled assets through Starlette's file response (sendfile path)
+# rather than Python-level reads; the dir only exists in some installs
+_STATIC_DIR = Path(__file__).parent / "static"
+if _STATIC_DIR.is_dir():
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
 # Global agent instance (per server process)
 _agent: Agent | None = None
 _agent_lock = threading.Lock()
-_ws_clients: list[WebSocket] = []
+
+
+class _ClientConn:
+    """One connected WebSocket client: the socket plus its outbound queue.
+
+    Broadcasts enqueue without blocking; a dedicated writer task per
+    client drains the queue, so one slow consumer never stalls the agent
+    thread or the other clients.
+    """
+
+    __slots__ = ("ws", "q", "drops")
+
+    def __init__(self, ws: WebSocket) -> None:
+        self.ws = ws
+        self.q: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=256)
+        self.drops = 0  # messages shed while this client lagged
+
+
+_ws_clients: set[_ClientConn] = set()
 _chat_task: asyncio.Task | None = None  # tracks the running chat task
 _research_abort = threading.Event()  # shared abort signal for research
 _research_agents: list[Agent] = []  # active research sub-agents (for probe)
@@ -40,77 +106,190 @@ _MAX_CRON_HISTORY = 50  # keep last N completed runs
 
 def _on_token_update(usage: dict) -> None:
     """Broadcast token usage updates to WebSocket clients."""
-    msg = json.dumps({"type": "token_update", **usage})
-    _broadcast(msg)
+    _broadcast_json({"type": "token_update", **usage})
 
 
 def _get_agent() -> Agent:
     global _agent
-    if _agent is None:
-        if not is_configured():
-            raise RuntimeError("Agent not configured. Complete setup first.")
-        cfg = get_agent_config()
-        _agent = Agent(
-            browser_profile=cfg.get("browser_profile"),
-            on_tool_call=_on_tool_call,
-            on_message=_on_message,
-            on_job_trigger=_on_job_change,
-            on_token_update=_on_token_update,
-            on_subtask_progress=_on_subtask_progress,
-        )
-        if not cfg.get("shell_enabled", True):
-            _agent._shell.enabled = False
-    return _agent
+    # Fast path: no lock once the singleton exists
+    if _agent is not None:
+        return _agent
+    with _agent_lock:
+        if _agent is None:  # double-check — another request may have won
+            if not is_configured():
+                raise RuntimeError("Agent not configured. Complete setup first.")
+            cfg = get_agent_config()
+            agent = Agent(
+                browser_profile=cfg.get("browser_profile"),
+                on_tool_call=_on_tool_call,
+                on_message=_on_message,
+                on_job_trigger=_on_job_change,
+                on_token_update=_on_token_update,
+                on_subtask_progress=_on_subtask_progress,
+            )
+            if not cfg.get("shell_enabled", True):
+                agent._shell.enabled = False
+            _agent = agent
+        return _agent
 
 
 def _on_tool_call(name: str, params: dict, result: str) -> None:
     """Broadcast tool calls to connected WebSocket clients."""
-    msg = json.dumps({
+    _broadcast_json({
         "type": "tool_call",
         "tool": name,
         "params": params,
-        "result": result[:2000],  # Cap for WS
+        "result": result[:2000] if len(result) > 2000 else result,  # Cap for WS
     })
-    _broadcast(msg)
 
 
 def _on_message(text: str) -> None:
     """Broadcast agent messages to WebSocket clients."""
-    msg = json.dumps({"type": "message", "content": text})
-    _broadcast(msg)
+    _broadcast_json({"type": "message", "content": text})
 
 
 def _on_subtask_progress(data: dict) -> None:
     """Broadcast subtask decomposition progress to WebSocket clients."""
-    msg = json.dumps({"type": "subtask_progress", **data})
-    _broadcast(msg)
+    _broadcast_json({"type": "subtask_progress", **data})
+
 
+def _enqueue(conn: _ClientConn, msg: str | bytes) -> None:
+    """Queue a message for one client, dropping the oldest when full.
 
-def _broadcast(msg: str) -> None:
-    """Send to all connected WebSocket clients."""
-    dead = []
-    for ws in _ws_clients:
+    Runs on the event loop (via call_soon_threadsafe), so queue access
+    is single-threaded.
+    """
+    try:
+        conn.q.put_nowait(msg)
+    except asyncio.QueueFull:
         try:
-            asyncio.run_coroutine_threadsafe(ws.send_text(msg), _loop)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        _ws_clients.remove(ws)
+            conn.q.get_nowait()
+            conn.drops += 1
+        except asyncio.QueueEmpty:
+            pass
+        conn.q.put_nowait(msg)
+
+
+def _fanout(msg: str | bytes) -> None:
+    """Enqueue a message for every connected client. Runs on the loop.
+
+    Iterates a snapshot: correctness must not hinge on nothing inside
+    the loop body ever touching the client set, and a tuple of a few
+    references is as cheap as that guarantee gets.
+    """
+    for conn in tuple(_ws_clients):
+        _enqueue(conn, msg)
+
+
+def _broadcast(msg: str | bytes) -> None:
+    """Queue a message for all connected WebSocket clients.
+
+    Called from agent worker threads — one call_soon_threadsafe hop
+    total (a callback append plus a self-pipe wakeup), with the
+    per-client enqueues running on the loop; the writer tasks do the
+    actual sends.
+    """
+    if _loop is None:
+        return
+    _loop.call_soon_threadsafe(_fanout, msg)
+
+
+# Max messages coalesced into one WS frame during a burst
+_WS_BATCH_MAX = 32
+
+
+def _broadcast_json(obj: dict) -> None:
+    """Serialize once and broadcast the shared bytes to every client."""
+    if not _ws_clients:
+        return  # nobody listening — skip serialization entirely
+    _broadcast(_dumps_bytes(obj))
+
+
+async def _ws_writer(conn: _ClientConn) -> None:
+    """Drain one client's outbound queue onto its socket.
+
+    Burst traffic (e.g. a tool loop emitting many small events) is
+    coalesced: whatever is already queued behind the first message goes
+    out as a single JSON array frame, cutting framing and syscall
+    overhead proportionally to burst size.
+    """
+    try:
+        while True:
+            batch = [await conn.q.get()]
+            while len(batch) < _WS_BATCH_MAX:
+                try:
+                    batch.append(conn.q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if len(batch) == 1:
+                msg = batch[0]
+                if isinstance(msg, bytes):
+                    await conn.ws.send_bytes(msg)  # pre-encoded, shared by all clients
+                else:
+                    await conn.ws.send_text(msg)
+            else:
+                # Items are already JSON — splice into an array without re-parsing
+                parts = [m if isinstance(m, bytes) else m.encode() for m in batch]
+                await conn.ws.send_bytes(b"[" + b",".join(parts) + b"]")
+            # Queue drained after shedding — tell the client what it missed
+            if conn.drops and conn.q.empty():
+                count, conn.drops = conn.drops, 0
+                await conn.ws.send_bytes(_dumps_bytes({"type": "dropped", "count": count}))
+    except Exception:
+        pass  # socket gone — endpoint cleanup removes the client
+    finally:
+        _ws_clients.discard(conn)
 
 
 _loop: asyncio.AbstractEventLoop = None  # type: ignore
 
 
+@app.on_event("startup")
+async def _on_startup() -> None:
+    """Per-process init: capture the loop, bound executor, scheduler.
+
+    Runs in each uvicorn worker, so multi-worker mode gets a working
+    broadcast loop per process.
+    """
+    global _loop
+    _loop = asyncio.get_running_loop()
+    # Bounded, named executor backing asyncio.to_thread — the stdlib
+    # default is unbounded, so a WS burst could spawn arbitrary threads
+    _loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=int(os.getenv("BPY_AGENT_WORKERS", "8")),
+        thread_name_prefix="agent",
+    ))
+    # Cron only runs single-worker — N workers would fire every job N times
+    if int(os.getenv("BPY_WORKERS", "1")) <= 1:
+        _start_scheduler()
+    # Pre-warm the singleton Agent so the first chat doesn't pay its
+    # construction cost (browser profile init, tool registration)
+    if is_configured():
+        try:
+            await asyncio.to_thread(_get_agent)
+        except Exception:
+            pass  # surface config problems on the first request, not at boot
+
+
 # ── REST API ──
 
 
+def _prepare_index() -> tuple[bytes, bytes, str]:
+    """Load the UI once: raw bytes, gzip variant, and a content ETag."""
+    ui_path = _STATIC_DIR / "index.html"
+    raw = ui_path.read_bytes() if ui_path.exists() else _FALLBACK_HTML.encode()
+    etag = f'"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+    return raw, gzip.compress(raw, compresslevel=9), etag
+
+
 @app.get("/")
-async def index() -> HTMLResponse:
-    """Serve the chat UI."""
-    ui_path = Path(__file__).parent / "static" / "index.html"
-    if ui_path.exists():
-        return HTMLResponse(ui_path.read_text())
-    return HTMLResponse(_FALLBACK_HTML)
+async def index(request: Request) -> Response:
+    """Serve the chat UI (cached and pre-compressed at import time)."""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return _INDEX_304
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return _INDEX_RESP_GZ
+    return _INDEX_RESP
 
 
 @app.post("/api/chat")
@@ -125,8 +304,7 @@ async def chat(body: dict) -> JSONResponse:
     except RuntimeError as e:
         return JSONResponse({"error": str(e)}, status_code=400)
 
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, agent.chat, message)
+    result = await asyncio.to_thread(agent.chat, message)
 
     return JSONResponse({
         "response": result,
@@ -174,7 +352,7 @@ async def config() -> JSONResponse:
     from browser_py.agent.config import PROVIDERS
     provider_fields = {}
     for pkey, pinfo in PROVIDERS.items():
-        fields = pinfo.get("fields", [])
+        fields = pinfo.fields
         pcfg = providers_cfg.get(pkey, {})
         non_secret = {}
         for f in fields:
@@ -290,8 +468,7 @@ async def flush_agent() -> JSONResponse:
     # Dump context immediately from here — don't wait for the loop
     dump_path = None
     if agent.messages:
-        loop = asyncio.get_event_loop()
-        dump_path = await loop.run_in_executor(None, agent._do_context_dump, "flush")
+        dump_path = await asyncio.to_thread(agent._do_context_dump, "flush")
 
     # Cancel the running chat task if any
     if _chat_task and not _chat_task.done():
@@ -335,10 +512,7 @@ async def start_research(body: dict) -> JSONResponse:
     cfg = get_agent_config()
 
     def on_progress(stage: str, message: str) -> None:
-        msg = json.dumps({"type": "research_progress", "stage": stage, "message": message})
-        _broadcast(msg)
-
-    import threading
+        _broadcast_json({"type": "research_progress", "stage": stage, "message": message})
 
     _research_abort.clear()
     _research_agents.clear()
@@ -360,22 +534,20 @@ async def start_research(body: dict) -> JSONResponse:
                 on_agent_created=on_agent_created,
             )
             if _research_abort.is_set():
-                msg = json.dumps({"type": "research_error", "error": "Flushed by user"})
+                _broadcast_json({"type": "research_error", "error": "Flushed by user"})
             else:
-                msg = json.dumps({
+                _broadcast_json({
                     "type": "research_complete",
                     "report_path": result["report_path"],
                     "report": result["report"][:50000],
                     "duration": result["duration_seconds"],
                     "subtopics": result["subtopics"],
                 })
-            _broadcast(msg)
         except Exception as e:
-            msg = json.dumps({
+            _broadcast_json({
                 "type": "research_error",
                 "error": str(e),
             })
-            _broadcast(msg)
         finally:
             _research_agents.clear()
 
@@ -395,9 +567,6 @@ async def validate_key(body: dict) -> JSONResponse:
     if not provider or not api_key:
         return JSONResponse({"valid": False, "error": "provider and api_key required"})
 
-    import asyncio
-    loop = asyncio.get_event_loop()
-
     def _validate() -> dict:
         try:
             from browser_py.agent.models import fetch_models
@@ -408,7 +577,7 @@ async def validate_key(body: dict) -> JSONResponse:
         except Exception as e:
             return {"valid": False, "error": str(e)}
 
-    result = await loop.run_in_executor(None, _validate)
+    result = await asyncio.to_thread(_validate)
     return JSONResponse(result)
 
 
@@ -479,8 +648,7 @@ async def trigger_job(body: dict) -> JSONResponse:
     if not job:
         return JSONResponse({"error": "Job not found"}, status_code=404)
 
-    import uuid as _uuid
-    run_id = f"{job_id}_{int(time.time())}_{_uuid.uuid4().hex[:4]}"
+    run_id = f"{job_id}_{int(time.time())}_{uuid.uuid4().hex[:4]}"
     task_text = job.get("task", "")
     job_name = job.get("name", task_text[:50])
 
@@ -625,13 +793,13 @@ async def list_providers() -> JSONResponse:
     result = {}
     for key, info in PROVIDERS.items():
         entry = {
-            "name": info["name"],
-            "default_model": info["default_model"],
-            "note": info.get("note", ""),
-            "is_oauth": info.get("is_oauth", False),
+            "name": info.name,
+            "default_model": info.default_model,
+            "note": info.note,
+            "is_oauth": info.is_oauth,
         }
-        if info.get("fields"):
-            entry["fields"] = info["fields"]
+        if info.fields:
+            entry["fields"] = list(info.fields)
         result[key] = entry
     return JSONResponse(result)
 
@@ -649,8 +817,7 @@ async def get_models(
     - q: filter models by search string
     - tool_use_only: only return models that support tool use
     """
-    from browser_py.agent.models import fetch_models
-    import asyncio
+    from browser_py.agent.models import fetch_models_async
 
     # Gather extra credentials from config for Bedrock etc.
     extra = {}
@@ -660,10 +827,7 @@ async def get_models(
         if pcfg.get(key):
             extra[key] = pcfg[key]
 
-    loop = asyncio.get_event_loop()
-    models = await loop.run_in_executor(
-        None, lambda: fetch_models(provider, api_key, extra, tool_use_only=tool_use_only)
-    )
+    models = await fetch_models_async(provider, api_key, extra, tool_use_only=tool_use_only)
 
     # Server-side search filter
     if q:
@@ -676,8 +840,7 @@ async def get_models(
 @app.get("/api/browse-dirs")
 async def browse_dirs(path: str = "~") -> JSONResponse:
     """List directories at a given path for folder picker."""
-    from pathlib import Path as P
-    resolved = P(path).expanduser().resolve()
+    resolved = Path(path).expanduser().resolve()
     if not resolved.is_dir():
         return JSONResponse({"error": "Not a directory"}, status_code=400)
     dirs = []
@@ -725,10 +888,10 @@ async def run_setup(body: dict) -> JSONResponse:
 
     # Store provider-specific fields (Bedrock, Azure, Vertex, etc.)
     from browser_py.agent.config import PROVIDERS as PROVIDER_DEFS
-    pinfo = PROVIDER_DEFS.get(provider, {})
-    if pinfo.get("fields"):
+    pinfo = PROVIDER_DEFS.get(provider)
+    if pinfo is not None and pinfo.fields:
         pcfg = providers_cfg.setdefault(provider, {})
-        for f in pinfo["fields"]:
+        for f in pinfo.fields:
             fkey = f["key"]
             val = body.get(fkey)
             if val is not None and val != "":
@@ -743,7 +906,6 @@ async def run_setup(body: dict) -> JSONResponse:
     if model:
         agent_cfg["model"] = model
     if workspace:
-        from pathlib import Path
         ws = Path(workspace).expanduser().resolve()
         ws.mkdir(parents=True, exist_ok=True)
         agent_cfg["workspace"] = str(ws)
@@ -779,86 +941,116 @@ async def run_setup(body: dict) -> JSONResponse:
 # ── WebSocket for live updates ──
 
 
+async def _ws_handle_chat(ws: WebSocket, msg: dict) -> None:
+    """Run one chat exchange over the socket."""
+    global _chat_task
+    try:
+        agent = _get_agent()
+    except RuntimeError as e:
+        await ws.send_text(json.dumps({
+            "type": "response",
+            "content": f"⚠️ {e}\nPlease complete setup in the Settings page.",
+        }))
+        return
+
+    # Check context limit before sending
+    usage = agent.get_token_usage()
+    if usage["critical"]:
+        await ws.send_text(json.dumps({
+            "type": "context_warning",
+            "level": "critical",
+            "message": (
+                f"⚠️ Context is {usage['usage_percent']}% full "
+                f"({usage['total_tokens']:,} / {usage['context_limit']:,} tokens). "
+                "Consider starting a new chat to avoid degraded responses."
+            ),
+            "usage": usage,
+        }))
+
+    await ws.send_text(json.dumps({"type": "thinking"}))
+
+    # Stream events as the agent produces them instead of blocking for
+    # the full turn; tool/message frames still broadcast to every client
+    stream = agent.chat_stream(msg.get("message", ""))
+
+    async def _consume() -> str:
+        result = ""
+        while True:
+            item = await asyncio.to_thread(next, stream, None)
+            if item is None:
+                break
+            if item["type"] == "response":
+                result = item["content"]
+            elif item["type"] == "error":
+                result = f"Error: {item['error']}"
+            else:
+                _broadcast_json(item)
+        return result
+
+    _chat_task = asyncio.ensure_future(_consume())
+    try:
+        result = await _chat_task
+    except asyncio.CancelledError:
+        result = "(Flushed — context saved to context_dumps/.)"
+    finally:
+        _chat_task = None
+
+    # Clean up browser tabs opened during this exchange
+    try:
+        await asyncio.to_thread(agent.cleanup_browser)
+    except Exception:
+        pass
+
+    # Auto-save session after each exchange
+    await asyncio.to_thread(agent.save_session)
+
+    await ws.send_text(json.dumps({
+        "type": "response",
+        "content": result,
+        "token_usage": agent.get_token_usage(),
+        "session_id": agent.session_id,
+    }))
+
+
+async def _ws_handle_reset(ws: WebSocket, msg: dict) -> None:
+    agent = _get_agent()
+    # Save current session before reset (if it has messages)
+    if agent.messages:
+        await asyncio.to_thread(agent.save_session)
+    agent.reset()
+    await ws.send_text(json.dumps({"type": "reset_ok"}))
+
+
+# Incoming frame types -> handlers; one dict lookup per message
+_WS_HANDLERS = {
+    "chat": _ws_handle_chat,
+    "reset": _ws_handle_reset,
+}
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket) -> None:
     await ws.accept()
-    _ws_clients.append(ws)
+    conn = _ClientConn(ws)
+    _ws_clients.add(conn)
+    writer = asyncio.create_task(_ws_writer(conn))
     try:
         while True:
-            data = await ws.receive_text()
-            msg = json.loads(data)
-
-            if msg.get("type") == "chat":
-                try:
-                    agent = _get_agent()
-                except RuntimeError as e:
-                    await ws.send_text(json.dumps({
-                        "type": "response",
-                        "content": f"⚠️ {e}\nPlease complete setup in the Settings page.",
-                    }))
-                    continue
-
-                # Check context limit before sending
-                usage = agent.get_token_usage()
-                if usage["critical"]:
-                    await ws.send_text(json.dumps({
-                        "type": "context_warning",
-                        "level": "critical",
-                        "message": (
-                            f"⚠️ Context is {usage['usage_percent']}% full "
-                            f"({usage['total_tokens']:,} / {usage['context_limit']:,} tokens). "
-                            "Consider starting a new chat to avoid degraded responses."
-                        ),
-                        "usage": usage,
-                    }))
-
-                await ws.send_text(json.dumps({"type": "thinking"}))
-
-                loop = asyncio.get_event_loop()
-                _chat_task = asyncio.ensure_future(
-                    loop.run_in_executor(None, agent.chat, msg.get("message", ""))
-                )
-                try:
-                    result = await _chat_task
-                except asyncio.CancelledError:
-                    result = "(Flushed — context saved to context_dumps/.)"
-                finally:
-                    _chat_task = None
-
-                # Clean up browser tabs opened during this exchange
-                try:
-                    await loop.run_in_executor(None, agent.cleanup_browser)
-                except Exception:
-                    pass
-
-                # Auto-save session after each exchange
-                session_meta = await loop.run_in_executor(None, agent.save_session)
-
-                await ws.send_text(json.dumps({
-                    "type": "response",
-                    "content": result,
-                    "token_usage": agent.get_token_usage(),
-                    "session_id": agent.session_id,
-                }))
-
-            elif msg.get("type") == "reset":
-                agent = _get_agent()
-                # Save current session before reset (if it has messages)
-                if agent.messages:
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, agent.save_session)
-                agent.reset()
-                await ws.send_text(json.dumps({"type": "reset_ok"}))
+            msg = _loads(await ws.receive_text())
+            handler = _WS_HANDLERS.get(msg.get("type"))
+            if handler is not None:
+                await handler(ws, msg)
 
     except WebSocketDisconnect:
-        if ws in _ws_clients:
-            _ws_clients.remove(ws)
         # Clean up browser tabs when client disconnects
         try:
             if _agent:
                 _agent.cleanup_browser()
         except Exception:
             pass
+    finally:
+        _ws_clients.discard(conn)
+        writer.cancel()
 
 
 # ── Scheduler ──
@@ -866,19 +1058,40 @@ async def websocket_endpoint(ws: WebSocket) -> None:
 
 _scheduler = None
 
+# Cron run log — one rotating file with a single open FD instead of a
+# fresh file created and fsynced per run
+_cron_logger: logging.Logger | None = None
+_cron_log_lock = threading.Lock()
+
+
+def _get_cron_logger() -> logging.Logger:
+    global _cron_logger
+    if _cron_logger is not None:
+        return _cron_logger
+    with _cron_log_lock:
+        if _cron_logger is None:
+            log_dir = get_workspace() / ".cron_logs"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            logger = logging.getLogger("browser_py.cron")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(
+                log_dir / "runs.log",
+                maxBytes=5 * 1024 * 1024,
+                backupCount=3,
+                encoding="utf-8",
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+            logger.addHandler(handler)
+            _cron_logger = logger
+        return _cron_logger
+
 
 def _add_job_to_scheduler(job: dict) -> None:
     """Add a single job to the running scheduler."""
     if _scheduler is None:
         return
 
-    try:
-        from apscheduler.triggers.cron import CronTrigger
-        from apscheduler.triggers.interval import IntervalTrigger
-        from apscheduler.triggers.date import DateTrigger
-    except ImportError:
-        return
-
     jid = job.get("id", "")
     task_text = job.get("task", "")
     job_name = job.get("name", task_text[:50])
@@ -892,7 +1105,10 @@ def _add_job_to_scheduler(job: dict) -> None:
     if job.get("paused"):
         return
 
-    if job.get("schedule_type") == "cron":
+    # Read schedule_type once and build the trigger; one add_job site
+    stype = job.get("schedule_type")
+    trigger = None
+    if stype == "cron":
         parts = job.get("cron", "").split()
         if len(parts) == 5:
             trigger = CronTrigger(
@@ -903,24 +1119,15 @@ def _add_job_to_scheduler(job: dict) -> None:
                 day_of_week=parts[4],
                 timezone=job.get("timezone") or None,
             )
-            _scheduler.add_job(
-                _run_scheduled_task, trigger,
-                args=[task_text, jid, job_name], id=jid,
-            )
-    elif job.get("schedule_type") == "interval":
-        minutes = job.get("interval_minutes", 60)
-        _scheduler.add_job(
-            _run_scheduled_task,
-            IntervalTrigger(minutes=minutes),
-            args=[task_text, jid, job_name],
-            id=jid,
-        )
-    elif job.get("schedule_type") == "date":
+    elif stype == "interval":
+        trigger = IntervalTrigger(minutes=job.get("interval_minutes", 60))
+    elif stype == "date":
+        trigger = DateTrigger(run_date=job["run_at"])
+
+    if trigger is not None:
         _scheduler.add_job(
-            _run_scheduled_task,
-            DateTrigger(run_date=job["run_at"]),
-            args=[task_text, jid, job_name],
-            id=jid,
+            _run_scheduled_task_async, trigger,
+            args=[task_text, jid, job_name], id=jid,
         )
 
 
@@ -951,7 +1158,6 @@ def _on_job_change(action: str, job: dict) -> None:
         task_text = job.get("task", "")
         job_name = job.get("name", task_text[:50])
         if task_text:
-            import threading
             threading.Thread(
                 target=_run_scheduled_task,
                 args=[task_text, jid, job_name],
@@ -962,31 +1168,42 @@ def _on_job_change(action: str, job: dict) -> None:
 
 
 def _start_scheduler() -> None:
-    """Start APScheduler for cron jobs."""
+    """Start APScheduler for cron jobs on the server's event loop.
+
+    AsyncIOScheduler rides the existing loop instead of spawning its own
+    thread + executor the way BackgroundScheduler does; jobs are
+    coroutine shims that push the blocking work to a worker thread.
+    """
     global _scheduler
 
-    try:
-        from apscheduler.schedulers.background import BackgroundScheduler
-    except ImportError:
+    if not _APS_AVAILABLE:
         return  # APScheduler not installed — cron disabled
 
     from browser_py.agent.tools.cron import _load_jobs
 
-    _scheduler = BackgroundScheduler()
+    _scheduler = AsyncIOScheduler(event_loop=_loop)
     jobs = _load_jobs()
 
     for jid, job in jobs.items():
         job["id"] = jid  # ensure id is set
         _add_job_to_scheduler(job)
 
+    try:
+        _get_cron_logger()  # open the run log now, not on the first job
+    except OSError:
+        pass
+
     _scheduler.start()
 
 
+async def _run_scheduled_task_async(task: str, job_id: str = "", job_name: str = "") -> None:
+    """Coroutine shim for scheduled jobs — keeps the blocking run off the loop."""
+    await asyncio.to_thread(_run_scheduled_task, task, job_id, job_name)
+
+
 def _run_scheduled_task(task: str, job_id: str = "", job_name: str = "") -> None:
     """Execute a scheduled task in a fresh agent context with full streaming."""
-    import uuid as _uuid
-
-    run_id = f"{job_id or 'manual'}_{int(time.time())}_{_uuid.uuid4().hex[:4]}"
+    run_id = f"{job_id or 'manual'}_{int(time.time())}_{uuid.uuid4().hex[:4]}"
     cfg = get_agent_config()
 
     run_record: dict[str, Any] = {
@@ -1011,13 +1228,13 @@ def _run_scheduled_task(task: str, job_id: str = "", job_name: str = "") -> None
             del _cron_runs[old_rid]
 
     # Broadcast that a cron run started
-    _broadcast(json.dumps({
+    _broadcast_json({
         "type": "cron_run_start",
         "run_id": run_id,
         "job_id": job_id,
         "job_name": run_record["job_name"],
         "task": task,
-    }))
+    })
 
     def _cron_tool_call(name: str, params: dict, result: str) -> None:
         event = {"type": "tool_call", "tool": name, "params": params, "result": result[:2000]}
@@ -1025,18 +1242,18 @@ def _run_scheduled_task(task: str, job_id: str = "", job_name: str = "") -> None
         # Cap events list
         if len(run_record["events"]) > 200:
             run_record["events"] = run_record["events"][-200:]
-        _broadcast(json.dumps({**event, "source": "cron", "run_id": run_id}))
+        _broadcast_json({**event, "source": "cron", "run_id": run_id})
 
     def _cron_subtask_progress(data: dict) -> None:
         run_record["events"].append(data)
         if len(run_record["events"]) > 200:
             run_record["events"] = run_record["events"][-200:]
-        _broadcast(json.dumps({**data, "source": "cron", "run_id": run_id}))
+        _broadcast_json({**data, "source": "cron", "run_id": run_id})
 
     def _cron_token_update(usage: dict) -> None:
-        _broadcast(json.dumps({
+        _broadcast_json({
             "type": "token_update", "source": "cron", "run_id": run_id, **usage,
-        }))
+        })
 
     agent = Agent(
         browser_profile=cfg.get("browser_profile"),
@@ -1053,34 +1270,27 @@ def _run_scheduled_task(task: str, job_id: str = "", job_name: str = "") -> None
         run_record["status"] = "done"
         run_record["result"] = result
 
-        # Log to disk
-        log_dir = get_workspace() / ".cron_logs"
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"{run_id}.log"
-        log_file.write_text(f"Task: {task}\n\nResult:\n{result}\n")
+        _get_cron_logger().info("run=%s task=%s result=%s", run_id, task, result)
 
-        _broadcast(json.dumps({
+        _broadcast_json({
             "type": "cron_run_done",
             "run_id": run_id,
             "job_id": job_id,
             "job_name": run_record["job_name"],
             "result": result[:5000],
-        }))
+        })
     except Exception as e:
         run_record["status"] = "error"
         run_record["result"] = str(e)
 
-        log_dir = get_workspace() / ".cron_logs"
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"{run_id}_error.log"
-        log_file.write_text(f"Task: {task}\n\nError:\n{e}\n")
+        _get_cron_logger().error("run=%s task=%s error=%s", run_id, task, e)
 
-        _broadcast(json.dumps({
+        _broadcast_json({
             "type": "cron_run_error",
             "run_id": run_id,
             "job_id": job_id,
             "error": str(e),
-        }))
+        })
     finally:
         run_record["ended"] = time.time()
         run_record["agent"] = None  # release agent reference
@@ -1094,19 +1304,41 @@ def _run_scheduled_task(task: str, job_id: str = "", job_name: str = "") -> None
 
 
 def start_server(host: str = "127.0.0.1", port: int = 8321) -> None:
-    """Start the web server."""
-    global _loop
+    """Start the web server.
+
+    Set BPY_WORKERS>1 (non-Windows) for multiple uvicorn workers sharing
+    the port via SO_REUSEPORT. Each worker is an independent process with
+    its own Agent and WebSocket clients; cron scheduling is disabled in
+    that mode to avoid duplicate runs.
+    """
     import uvicorn
 
     print(f"\n🌐 browser-py agent running at http://{host}:{port}\n")
 
-    _start_scheduler()
+    # permessage-deflate shrinks the verbose tool_call/response frames
+    # ~5-10x; BPY_WS_DEFLATE=0 opts out for CPU-bound local setups
+    deflate = os.getenv("BPY_WS_DEFLATE", "1") != "0"
+
+    workers = int(os.getenv("BPY_WORKERS", "1"))
+    if workers > 1 and sys.platform != "win32":
+        # workers requires the app as an import string
+        uvicorn.run(
+            "browser_py.server.app:app",
+            host=host, port=port, workers=workers, log_level="warning",
+            ws_per_message_deflate=deflate,
+        )
+        return
 
-    config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+    if uvloop is not None:
+        uvloop.install()  # new_event_loop below then returns a uvloop loop
+    config = uvicorn.Config(
+        app, host=host, port=port, log_level="warning",
+        ws_per_message_deflate=deflate,
+    )
     server = uvicorn.Server(config)
-    _loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(_loop)
-    _loop.run_until_complete(server.serve())
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.serve())
 
 
 # ── Fallback HTML (embedded chat UI) ──
@@ -2451,8 +2683,13 @@ function connect() {
     }).catch(() => {});
   };
   ws.onclose = () => { statusEl.textContent = 'Disconnected'; setTimeout(connect, 2000); };
-  ws.onmessage = (e) => {
-    const msg = JSON.parse(e.data);
+  ws.onmessage = async (e) => {
+    // Broadcast frames arrive as binary (pre-encoded bytes); direct replies as
+    // text. Bursts are coalesced server-side into one JSON array frame.
+    const data = JSON.parse(typeof e.data === 'string' ? e.data : await e.data.text());
+    if (Array.isArray(data)) { data.forEach(handleWsMsg); } else { handleWsMsg(data); }
+  };
+  const handleWsMsg = (msg) => {
 
     // ── Cron run events ──
     // Events from cron jobs have source="cron" and run_id
@@ -3167,3 +3404,19 @@ init();
 </body>
 </html>
 """
+
+# Built once the fallback HTML above exists; index() serves these directly.
+# The Response objects are cached too — the body is static, so per-request
+# construction and header assembly buy nothing. no-cache still lets the
+# browser cache but revalidates via ETag, so a server upgrade shows the
+# new UI immediately.
+_INDEX_BYTES, _INDEX_GZ, _INDEX_ETAG = _prepare_index()
+_INDEX_304 = Response(status_code=304, headers={"ETag": _INDEX_ETAG})
+_INDEX_RESP = Response(
+    _INDEX_BYTES, media_type="text/html",
+    headers={"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"},
+)
+_INDEX_RESP_GZ = Response(
+    _INDEX_GZ, media_type="text/html",
+    headers={"ETag": _INDEX_ETAG, "Cache-Control": "no-cache", "Content-Encoding": "gzip"},
+)